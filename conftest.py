@@ -1,18 +1,29 @@
 """Global test configuration and fixtures."""
 
 import asyncio
+import hashlib
+import json
+import sys
+import allure
+import httpx
+from jsonschema import Draft7Validator
+from pathlib import Path
 import pytest
 import pytest_asyncio
-from typing import AsyncGenerator, Generator
-from playwright.async_api import async_playwright, Playwright, Browser, BrowserContext, Page, APIRequestContext
+from types import MappingProxyType
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, FrozenSet, Generator, List, Mapping, Optional, Tuple
+from playwright.async_api import async_playwright, Playwright, Browser, BrowserContext, Page, APIRequestContext, StorageState
 
 from src.config import get_settings
 from src.pages import WeatherPage
-from src.api import WeatherAPIClient
-from src.utils import get_logger
+from src.api import FORECAST_SCHEMA, WEATHER_SCHEMA, ApiResponse, WeatherAPIClient
+from src.utils import RouteCache, get_logger, write_atomic
 
 logger = get_logger(__name__)
 
+# JSON payloads a test wants attached to its report if it fails
+_failure_attachments_key = pytest.StashKey[List[Tuple[str, Any]]]()
+
 
 def pytest_addoption(parser: pytest.Parser) -> None:
     """Add custom command line options."""
@@ -36,9 +47,44 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         type=int,
         help="Slow down operations by specified milliseconds"
     )
+    parser.addoption(
+        "--no-api-cache",
+        action="store_true",
+        default=False,
+        help="Disable caching of identical API responses within a session"
+    )
+    parser.addoption(
+        "--api-cache",
+        action="store_true",
+        default=False,
+        help="Persist API responses in the pytest cache between runs (reset with --cache-clear)"
+    )
+    parser.addoption(
+        "--api-cache-ttl",
+        action="store",
+        default=600,
+        type=float,
+        help="Maximum age in seconds of a persisted API response before it is fetched again"
+    )
+    parser.addoption(
+        "--ui-cache",
+        action="store_true",
+        default=False,
+        help="Serve OpenWeatherMap pages, assets and first-visit browser state from the pytest cache between runs (reset with --cache-clear)"
+    )
 
 
-# Event loop is handled by pytest-asyncio automatically
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run the session event loop on uvloop where it is installed, else on the default policy."""
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            logger.info("uvloop not installed; using the default asyncio event loop")
+        else:
+            return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
 
 
 @pytest.fixture(scope="session")
@@ -47,6 +93,28 @@ def settings():
     return get_settings()
 
 
+@pytest.fixture(scope="session")
+def api_settings(settings):
+    """Get settings for tests that call OpenWeatherMap directly, skipping them without an API key."""
+    if not settings.openweather_api_key:
+        pytest.skip("OpenWeatherMap API key not provided")
+    return settings
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _prepare_dirs(settings) -> None:
+    """Create artifact directories once instead of on every write."""
+    for path in (
+        "test-results/screenshots",
+        "test-results/videos",
+        "test-results/traces",
+        "reports/screenshots",
+        settings.allure_results_dir,
+        settings.html_report_dir
+    ):
+        Path(path).mkdir(parents=True, exist_ok=True)
+
+
 @pytest_asyncio.fixture(scope="session")
 async def playwright() -> AsyncGenerator[Playwright, None]:
     """Initialize Playwright."""
@@ -89,22 +157,61 @@ async def browser(playwright: Playwright, request: pytest.FixtureRequest) -> Asy
     await browser_instance.close()
 
 
-@pytest_asyncio.fixture
-async def context(browser: Browser, settings) -> AsyncGenerator[BrowserContext, None]:
-    """Create browser context with configuration."""
-    context_options = {
+def _context_options(settings) -> dict:
+    """Build the options shared by every browser context."""
+    options = {
         "viewport": {"width": 1920, "height": 1080},
         "user_agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
         "locale": "en-US",
         "timezone_id": "America/New_York",
-        "permissions": ["geolocation"],
-        "record_video_dir": "test-results/videos" if settings.video_mode != "off" else None,
-        "record_video_size": {"width": 1920, "height": 1080}
+        "permissions": ["geolocation"]
     }
     
-    context_instance = await browser.new_context(**context_options)
+    # Video is only recorded on explicit request; failures are diagnosed from trace chunks
+    if settings.video_mode == "on":
+        options["record_video_dir"] = "test-results/videos"
+        options["record_video_size"] = {"width": 1920, "height": 1080}
+    return options
+
+
+@pytest_asyncio.fixture(scope="session")
+async def ui_storage_state(browser: Browser, settings, request: pytest.FixtureRequest) -> Optional[StorageState]:
+    """Load the cached first-visit browser state, recording it once if it is missing."""
+    if not request.config.getoption("--ui-cache"):
+        return None
+        
+    # Keyed by base URL so switching environments never reuses another site's cookies
+    digest = hashlib.sha256(settings.ui_base_url.encode()).hexdigest()[:16]
+    state_path = request.config.cache.mkdir("owm_ui_state") / f"owm_state_{digest}.json"
+    if not state_path.is_file():
+        priming_context = await browser.new_context(**_context_options(settings))
+        try:
+            await WeatherPage(await priming_context.new_page()).navigate_to_weather_page()
+            write_atomic(state_path, json.dumps(await priming_context.storage_state()))
+            logger.info(f"Recorded browser storage state: {state_path}")
+        finally:
+            await priming_context.close()
+    return json.loads(state_path.read_text(encoding="utf-8"))
+
+
+@pytest_asyncio.fixture(scope="session")
+async def context(
+    browser: Browser,
+    settings,
+    ui_storage_state: Optional[StorageState],
+    request: pytest.FixtureRequest
+) -> AsyncGenerator[BrowserContext, None]:
+    """Create a browser context shared by the whole test session."""
+    context_instance = await browser.new_context(
+        **_context_options(settings),
+        storage_state=ui_storage_state
+    )
     
-    # Enable tracing for debugging
+    if request.config.getoption("--ui-cache"):
+        route_cache = RouteCache(request.config.cache.mkdir("owm_ui_responses"))
+        await context_instance.route(RouteCache.URL_PATTERN, route_cache.handle)
+    
+    # Tracing runs for the whole session; each test records its own chunk
     await context_instance.tracing.start(
         screenshots=True,
         snapshots=True,
@@ -113,14 +220,28 @@ async def context(browser: Browser, settings) -> AsyncGenerator[BrowserContext,
     
     yield context_instance
     
-    # Stop tracing and save
-    await context_instance.tracing.stop(path="test-results/trace.zip")
+    await context_instance.tracing.stop()
     await context_instance.close()
 
 
 @pytest_asyncio.fixture
+async def trace_chunk(context: BrowserContext, request: pytest.FixtureRequest) -> AsyncGenerator[None, None]:
+    """Record a tracing chunk for the current test, keeping it only on failure."""
+    await context.tracing.start_chunk(title=request.node.name)
+    yield
+    
+    if hasattr(request.node, "rep_call") and request.node.rep_call.failed:
+        trace_path = f"test-results/traces/{request.node.name}.zip"
+        await context.tracing.stop_chunk(path=trace_path)
+        logger.error(f"Test failed. Trace saved: {trace_path}")
+    else:
+        # Discard the chunk without serializing it
+        await context.tracing.stop_chunk()
+
+
+@pytest_asyncio.fixture(scope="session")
 async def page(context: BrowserContext) -> AsyncGenerator[Page, None]:
-    """Create a new page."""
+    """Create a page shared by the whole test session."""
     page_instance = await context.new_page()
     
     # Set default timeout
@@ -136,8 +257,23 @@ async def page(context: BrowserContext) -> AsyncGenerator[Page, None]:
 
 
 @pytest_asyncio.fixture
+async def page_artifacts(
+    page: Page,
+    trace_chunk: None,
+    request: pytest.FixtureRequest
+) -> AsyncGenerator[None, None]:
+    """Record the current test's trace chunk and screenshot the shared page if it fails."""
+    yield
+    
+    if hasattr(request.node, "rep_call") and request.node.rep_call.failed:
+        screenshot_path = f"test-results/screenshots/{request.node.name}.png"
+        await page.screenshot(path=screenshot_path)
+        logger.error(f"Test failed. Screenshot saved: {screenshot_path}")
+
+
+@pytest_asyncio.fixture(scope="session")
 async def api_context(playwright: Playwright, settings) -> AsyncGenerator[APIRequestContext, None]:
-    """Create API request context."""
+    """Create API request context shared by the whole test session."""
     api_context_instance = await playwright.request.new_context(
         base_url=settings.openweather_base_url,
         extra_http_headers={
@@ -149,100 +285,193 @@ async def api_context(playwright: Playwright, settings) -> AsyncGenerator[APIReq
     await api_context_instance.dispose()
 
 
+@pytest_asyncio.fixture(scope="session")
+async def http_client(api_settings) -> AsyncGenerator[httpx.AsyncClient, None]:
+    """Create an HTTP/2 httpx client whose connection pool is shared by the whole test session."""
+    async with httpx.AsyncClient(
+        base_url=api_settings.openweather_base_url,
+        params={"appid": api_settings.openweather_api_key},
+        headers={"User-Agent": "OpenWeatherMap-QA-Automation/1.0"},
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+        timeout=httpx.Timeout(10, connect=5),
+        http2=True
+    ) as client:
+        yield client
+
+
+# Module-level so the memoized responses survive for the whole session
+_http_cache: Dict[Tuple[str, FrozenSet[Tuple[str, Any]]], httpx.Response] = {}
+
+
+async def _cached_get(client: httpx.AsyncClient, url: str, params: Optional[Dict[str, Any]] = None) -> httpx.Response:
+    """GET through the session cache, storing only successful responses."""
+    params = params or {}
+    key = (url, frozenset(params.items()))
+    cached = _http_cache.get(key)
+    if cached is not None:
+        return cached
+        
+    response = await client.get(url, params=params)
+    if response.is_success:
+        _http_cache[key] = response
+    return response
+
+
+@pytest.fixture(scope="session")
+def cached_get(http_client: httpx.AsyncClient, request: pytest.FixtureRequest) -> Callable[..., Awaitable[httpx.Response]]:
+    """Return a GET function that memoizes identical successful requests for the session."""
+    if request.config.getoption("--no-api-cache"):
+        return http_client.get
+        
+    async def get(url: str, params: Optional[Dict[str, Any]] = None) -> httpx.Response:
+        return await _cached_get(http_client, url, params)
+        
+    return get
+
+
 # Page Object Fixtures
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="session")
 async def weather_page(page: Page) -> WeatherPage:
-    """Create WeatherPage instance."""
+    """Create a WeatherPage instance shared by the whole test session."""
     return WeatherPage(page)
 
 
-# API Client Fixtures
 @pytest_asyncio.fixture
-async def weather_api(api_context: APIRequestContext) -> WeatherAPIClient:
-    """Create WeatherAPIClient instance."""
-    return WeatherAPIClient(api_context)
+async def fresh_page(weather_page: WeatherPage, page_artifacts: None, ui_storage_state: Optional[StorageState]) -> None:
+    """Reset the shared page before each test instead of opening a new one."""
+    await weather_page.reset(ui_storage_state)
 
 
-# Test Data Fixtures
-@pytest.fixture
-def valid_cities() -> list[str]:
-    """List of valid cities for testing."""
-    return [
-        "London",
-        "New York",
-        "Tokyo",
-        "Paris",
-        "Berlin",
-        "Sydney",
-        "Moscow",
-        "Mumbai"
-    ]
+# API Client Fixtures
+@pytest_asyncio.fixture(scope="session")
+async def weather_api(api_context: APIRequestContext, request: pytest.FixtureRequest) -> AsyncGenerator[WeatherAPIClient, None]:
+    """Create a WeatherAPIClient shared by the whole test session."""
+    use_cache = not request.config.getoption("--no-api-cache")
+    cache_dir = None
+    if request.config.getoption("--api-cache"):
+        cache_dir = request.config.cache.mkdir("owm_api_responses")
+    client = WeatherAPIClient(
+        api_context,
+        use_cache=use_cache,
+        cache_dir=cache_dir,
+        cache_ttl=request.config.getoption("--api-cache-ttl")
+    )
+    yield client
+    await client.close()
 
 
-@pytest.fixture
-def invalid_cities() -> list[str]:
-    """List of invalid cities for testing."""
-    return [
-        "InvalidCityName123",
-        "NonExistentPlace",
-        "zzzzz",
-        "12345",
-        "",
-        "   "
-    ]
+# Cities whose API responses the E2E journeys look up
+_PRECHECK_CITIES: tuple[str, ...] = ("London", "Paris", "Tokyo", "InvalidCityXYZ123")
 
 
-@pytest.fixture
-def test_coordinates() -> list[dict]:
-    """List of test coordinates."""
-    return [
+@pytest_asyncio.fixture(scope="session")
+async def precomputed_api_responses(weather_api: WeatherAPIClient) -> Mapping[str, ApiResponse]:
+    """Fetch the E2E precheck responses for every city in one concurrent burst."""
+    results = await asyncio.gather(*(weather_api.get_current_weather(city) for city in _PRECHECK_CITIES))
+    return MappingProxyType(dict(zip(_PRECHECK_CITIES, results)))
+
+
+# Response Schema Fixtures
+@pytest.fixture(scope="session")
+def weather_validator() -> Draft7Validator:
+    """Create a validator for current weather responses, checked once per session."""
+    Draft7Validator.check_schema(WEATHER_SCHEMA)
+    return Draft7Validator(WEATHER_SCHEMA)
+
+
+@pytest.fixture(scope="session")
+def forecast_validator() -> Draft7Validator:
+    """Create a validator for forecast responses, checked once per session."""
+    Draft7Validator.check_schema(FORECAST_SCHEMA)
+    return Draft7Validator(FORECAST_SCHEMA)
+
+
+# Test Data Fixtures
+_VALID_CITIES: tuple[str, ...] = (
+    "London",
+    "New York",
+    "Tokyo",
+    "Paris",
+    "Berlin",
+    "Sydney",
+    "Moscow",
+    "Mumbai"
+)
+
+_INVALID_CITIES: tuple[str, ...] = (
+    "InvalidCityName123",
+    "NonExistentPlace",
+    "zzzzz",
+    "12345",
+    "",
+    "   "
+)
+
+_TEST_COORDINATES: tuple[Mapping[str, Any], ...] = tuple(
+    MappingProxyType(coordinates) for coordinates in (
         {"lat": 51.5074, "lon": -0.1278, "city": "London"},
         {"lat": 40.7128, "lon": -74.0060, "city": "New York"},
         {"lat": 35.6762, "lon": 139.6503, "city": "Tokyo"},
         {"lat": 48.8566, "lon": 2.3522, "city": "Paris"}
-    ]
+    )
+)
 
 
-# Hooks and Configuration
-def pytest_configure(config: pytest.Config) -> None:
-    """Configure pytest with custom markers."""
-    config.addinivalue_line("markers", "smoke: marks tests as smoke tests")
-    config.addinivalue_line("markers", "regression: marks tests as regression tests")
-    config.addinivalue_line("markers", "ui: marks tests as UI tests")
-    config.addinivalue_line("markers", "api: marks tests as API tests")
-    config.addinivalue_line("markers", "e2e: marks tests as end-to-end tests")
-    config.addinivalue_line("markers", "performance: marks tests as performance tests")
-    config.addinivalue_line("markers", "accessibility: marks tests as accessibility tests")
-    config.addinivalue_line("markers", "critical: marks tests as critical functionality")
-    config.addinivalue_line("markers", "slow: marks tests as slow running")
-    config.addinivalue_line("markers", "simple: marks tests as simple verification tests")
-    config.addinivalue_line("markers", "basic: marks tests as basic functionality tests")
+@pytest.fixture(scope="session")
+def valid_cities() -> tuple[str, ...]:
+    """Valid cities for testing."""
+    return _VALID_CITIES
+
+
+@pytest.fixture(scope="session")
+def invalid_cities() -> tuple[str, ...]:
+    """Invalid cities for testing."""
+    return _INVALID_CITIES
+
+
+@pytest.fixture(scope="session")
+def test_coordinates() -> tuple[Mapping[str, Any], ...]:
+    """Read-only test coordinates."""
+    return _TEST_COORDINATES
+
+
+# Reporting Fixtures
+def _attach_json(data: Any, name: str) -> None:
+    """Attach data to the Allure report as compact JSON."""
+    allure.attach(
+        json.dumps(data, separators=(",", ":"), default=str),
+        name=name,
+        attachment_type=allure.attachment_type.JSON
+    )
+
+
+@pytest.fixture
+def attach_json_on_failure(request: pytest.FixtureRequest) -> Callable[[Any, str], None]:
+    """Collect JSON payloads that are attached to the report only if the test fails."""
+    pending: List[Tuple[str, Any]] = []
+    request.node.stash[_failure_attachments_key] = pending
+    
+    def add(data: Any, name: str) -> None:
+        pending.append((name, data))
+        
+    return add
 
 
+# Hooks and Configuration
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo) -> Generator:
     """Make test results available to fixtures."""
     outcome = yield
     rep = outcome.get_result()
     setattr(item, "rep_" + rep.when, rep)
-
-
-@pytest_asyncio.fixture(autouse=True)
-async def handle_test_failure(request: pytest.FixtureRequest):
-    """Handle test failures by taking screenshots."""
-    yield
     
-    # Only handle failures for UI tests that have page fixture
-    if hasattr(request.node, "rep_call") and request.node.rep_call.failed:
-        # Check if this is a UI test by looking for page fixture
-        if "page" in request.fixturenames:
-            page = request.getfixturevalue("page")
-            # Take screenshot on failure
-            screenshot_path = f"test-results/screenshots/{request.node.name}.png"
-            await page.screenshot(path=screenshot_path)
-            logger.error(f"Test failed. Screenshot saved: {screenshot_path}")
-        else:
-            logger.error(f"Test failed: {request.node.name}")
+    # UI failures are reported by the page_artifacts fixture together with the screenshot
+    if rep.when == "call" and rep.failed and "page" not in getattr(item, "fixturenames", ()):
+        logger.error(f"Test failed: {item.name}")
+        
+    if rep.when == "call" and rep.failed:
+        for name, data in item.stash.get(_failure_attachments_key, ()):
+            _attach_json(data, name)
 
 
 # Custom markers for parametrization
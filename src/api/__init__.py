@@ -1,5 +1,6 @@
 """API client modules for testing."""
 
-from .weather_api import WeatherAPIClient
+from .schemas import FORECAST_SCHEMA, WEATHER_SCHEMA
+from .weather_api import ApiResponse, WeatherAPIClient
 
-__all__ = ["WeatherAPIClient"] 
\ No newline at end of file
+__all__ = ["ApiResponse", "WeatherAPIClient", "WEATHER_SCHEMA", "FORECAST_SCHEMA"] 
\ No newline at end of file
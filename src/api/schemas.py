@@ -0,0 +1,41 @@
+"""JSON schemas for OpenWeatherMap API responses."""
+
+from typing import Any, Dict
+
+WEATHER_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "required": ["coord", "weather", "main", "wind", "clouds", "dt", "sys", "id", "name"],
+    "properties": {
+        "name": {"type": "string"},
+        "coord": {
+            "type": "object",
+            "required": ["lat", "lon"],
+            "properties": {
+                "lat": {"type": "number"},
+                "lon": {"type": "number"}
+            }
+        },
+        "main": {
+            "type": "object",
+            "required": ["temp"],
+            "properties": {
+                "temp": {"type": "number"}
+            }
+        }
+    }
+}
+
+FORECAST_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "required": ["cod", "message", "cnt", "list", "city"],
+    "properties": {
+        "list": {
+            "type": "array",
+            "minItems": 1,
+            "items": {
+                "type": "object",
+                "required": ["dt", "main"]
+            }
+        }
+    }
+}
\ No newline at end of file
@@ -1,27 +1,244 @@
 """OpenWeatherMap API client for testing."""
 
-from typing import Any, Dict, Optional
-from playwright.async_api import APIRequestContext
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, FrozenSet, Optional, Tuple
 from src.config import get_settings
-from src.utils import get_logger
+from src.utils import get_logger, load_json, write_atomic
+
+if TYPE_CHECKING:
+    from playwright.async_api import APIRequestContext, APIResponse
+
+# Top-level fields every weather / forecast response must contain
+_REQUIRED_WEATHER: FrozenSet[str] = frozenset(
+    ("coord", "weather", "main", "wind", "clouds", "dt", "sys", "id", "name")
+)
+_REQUIRED_FORECAST: FrozenSet[str] = frozenset(("cod", "message", "cnt", "list", "city"))
+
+
+_UNSET: Any = object()
+
+
+@dataclass
+class ApiResponse:
+    """API response whose headers and body are only materialized when accessed."""
+    
+    status: int
+    _response: Optional[APIResponse] = field(repr=False)
+    _data: Any = field(default=_UNSET, init=False, repr=False)
+    
+    @classmethod
+    def from_payload(cls, status: int, headers: Dict[str, str], data: Any) -> ApiResponse:
+        """Build a response from already materialized values.
+        
+        Args:
+            status: HTTP status code.
+            headers: Response headers.
+            data: Parsed response body.
+            
+        Returns:
+            API response that needs no live Playwright response.
+        """
+        response = cls(status, None)
+        response.__dict__["headers"] = headers
+        response._data = data
+        return response
+        
+    def to_payload(self) -> Dict[str, Any]:
+        """Serialize the response once its body has been read.
+        
+        Returns:
+            Dictionary with status, headers and data.
+        """
+        return {"status": self.status, "headers": self.headers, "data": self._data}
+    
+    @property
+    def ok(self) -> bool:
+        """Whether the status code is in the 2xx range."""
+        return 200 <= self.status <= 299
+        
+    @cached_property
+    def headers(self) -> Dict[str, str]:
+        """Response headers."""
+        return dict(self._live_response().headers)
+        
+    async def data(self) -> Any:
+        """Get the response body, parsed once and reused on later calls.
+        
+        Returns:
+            Parsed JSON for successful responses, raw text otherwise.
+        """
+        if self._data is _UNSET:
+            response = self._live_response()
+            self._data = load_json(await response.body()) if self.ok else await response.text()
+        return self._data
+        
+    async def dispose(self) -> None:
+        """Release the body buffered by the wrapped Playwright response, if any."""
+        if self._response is not None:
+            await self._response.dispose()
+            
+    def _live_response(self) -> APIResponse:
+        """Get the wrapped Playwright response.
+        
+        Returns:
+            Playwright APIResponse instance.
+            
+        Raises:
+            RuntimeError: If the response was restored from a payload.
+        """
+        if self._response is None:
+            raise RuntimeError("Response restored from a payload has no live Playwright response")
+        return self._response
 
 
 class WeatherAPIClient:
     """Client for OpenWeatherMap API testing using Playwright's APIRequestContext."""
     
-    def __init__(self, request_context: APIRequestContext) -> None:
+    _logger: ClassVar[logging.Logger] = get_logger("WeatherAPIClient")
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Give every client subclass its own logger, created once."""
+        super().__init_subclass__(**kwargs)
+        cls._logger = get_logger(cls.__name__)
+        
+    def __init__(
+        self,
+        request_context: APIRequestContext,
+        use_cache: bool = False,
+        cache_dir: Optional[Path] = None,
+        cache_ttl: float = 600
+    ) -> None:
         """Initialize the weather API client.
         
         Args:
             request_context: Playwright APIRequestContext instance.
+            use_cache: Reuse successful responses for identical requests.
+            cache_dir: Directory persisting successful responses across runs.
+            cache_ttl: Maximum age in seconds of a persisted response.
         """
         self.request_context = request_context
         self.settings = get_settings()
-        self.logger = get_logger(self.__class__.__name__)
+        self.logger = self._logger
         self.base_url = self.settings.openweather_base_url
         self.api_key = self.settings.openweather_api_key
+        # Defaults shared by every weather endpoint; explicit kwargs override them
+        self._base_params: Dict[str, Any] = {"appid": self.api_key, "units": "metric"}
+        self.use_cache = use_cache
+        self._cache: Dict[Tuple[str, FrozenSet[Tuple[str, Any]]], ApiResponse] = {}
+        self.cache_dir = cache_dir
+        self.cache_ttl = cache_ttl
+        if cache_dir is not None:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+        
+    def clear_cache(self) -> None:
+        """Drop all cached responses."""
+        self._cache.clear()
+        
+    async def close(self) -> None:
+        """Dispose cached responses and empty the cache.
+        
+        The request context is owned by the caller and is left open.
+        """
+        for response in self._cache.values():
+            await response.dispose()
+        self.clear_cache()
+        
+    async def _get(self, url: str, params: Dict[str, Any]) -> ApiResponse:
+        """Send a GET request, serving repeated requests from the cache when enabled.
+        
+        Args:
+            url: Endpoint URL.
+            params: Query parameters.
+            
+        Returns:
+            API response.
+        """
+        key = (url, frozenset(params.items()))
+        if self.use_cache and key in self._cache:
+            return self._cache[key]
+            
+        result = self._read_disk_cache(url, params)
+        if result is None:
+            result = self._wrap(await self.request_context.get(url, params=params))
+            await self._write_disk_cache(url, params, result)
         
-    async def get_current_weather(self, city: str, **kwargs) -> Dict[str, Any]:
+        # Only successful responses are cached so errors and rate limits are retried
+        if self.use_cache and result.ok:
+            self._cache[key] = result
+        return result
+        
+    def _disk_cache_path(self, url: str, params: Dict[str, Any]) -> Optional[Path]:
+        """Get the cache file for a request.
+        
+        The key covers the URL and every parameter, so a different API key or
+        base URL never reuses another configuration's responses.
+        
+        Args:
+            url: Endpoint URL.
+            params: Query parameters.
+            
+        Returns:
+            Cache file path, or None if the disk cache is disabled.
+        """
+        if self.cache_dir is None:
+            return None
+        digest = hashlib.sha256((url + json.dumps(params, sort_keys=True)).encode()).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+        
+    def _read_disk_cache(self, url: str, params: Dict[str, Any]) -> Optional[ApiResponse]:
+        """Load a previously stored response.
+        
+        Args:
+            url: Endpoint URL.
+            params: Query parameters.
+            
+        Returns:
+            Cached API response, or None on a miss or if the entry is older than the TTL.
+        """
+        path = self._disk_cache_path(url, params)
+        if path is None or not path.is_file():
+            return None
+        if time.time() - path.stat().st_mtime > self.cache_ttl:
+            return None
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        self.logger.info(f"Serving cached response from: {path.name}")
+        return ApiResponse.from_payload(payload["status"], payload["headers"], payload["data"])
+        
+    async def _write_disk_cache(self, url: str, params: Dict[str, Any], result: ApiResponse) -> None:
+        """Persist a successful response.
+        
+        Args:
+            url: Endpoint URL.
+            params: Query parameters.
+            result: Response to store.
+        """
+        path = self._disk_cache_path(url, params)
+        if path is None or not result.ok:
+            return
+        await result.data()
+        write_atomic(path, json.dumps(result.to_payload()))
+        
+    @staticmethod
+    def _wrap(response: APIResponse) -> ApiResponse:
+        """Wrap a Playwright response without reading its headers or body.
+        
+        Args:
+            response: Playwright APIResponse instance.
+            
+        Returns:
+            Lazily evaluated API response.
+        """
+        return ApiResponse(response.status, response)
+        
+    async def get_current_weather(self, city: str, **kwargs: Any) -> ApiResponse:
         """Get current weather data for a city.
         
         Args:
@@ -29,29 +246,19 @@ class WeatherAPIClient:
             **kwargs: Additional query parameters.
             
         Returns:
-            API response as dictionary.
+            API response.
         """
         params = {
+            **self._base_params,
             "q": city,
-            "appid": self.api_key,
-            "units": kwargs.get("units", "metric"),
             **kwargs
         }
         
         self.logger.info(f"Getting current weather for: {city}")
         
-        response = await self.request_context.get(
-            f"{self.base_url}/weather",
-            params=params
-        )
+        return await self._get(f"{self.base_url}/weather", params)
         
-        return {
-            "status": response.status,
-            "headers": dict(response.headers),
-            "data": await response.json() if response.ok else await response.text()
-        }
-        
-    async def get_weather_by_coordinates(self, lat: float, lon: float, **kwargs) -> Dict[str, Any]:
+    async def get_weather_by_coordinates(self, lat: float, lon: float, **kwargs: Any) -> ApiResponse:
         """Get weather data by geographical coordinates.
         
         Args:
@@ -60,30 +267,20 @@ class WeatherAPIClient:
             **kwargs: Additional query parameters.
             
         Returns:
-            API response as dictionary.
+            API response.
         """
         params = {
+            **self._base_params,
             "lat": lat,
             "lon": lon,
-            "appid": self.api_key,
-            "units": kwargs.get("units", "metric"),
             **kwargs
         }
         
         self.logger.info(f"Getting weather for coordinates: {lat}, {lon}")
         
-        response = await self.request_context.get(
-            f"{self.base_url}/weather",
-            params=params
-        )
-        
-        return {
-            "status": response.status,
-            "headers": dict(response.headers),
-            "data": await response.json() if response.ok else await response.text()
-        }
+        return await self._get(f"{self.base_url}/weather", params)
         
-    async def get_weather_by_city_id(self, city_id: int, **kwargs) -> Dict[str, Any]:
+    async def get_weather_by_city_id(self, city_id: int, **kwargs: Any) -> ApiResponse:
         """Get weather data by city ID.
         
         Args:
@@ -91,29 +288,19 @@ class WeatherAPIClient:
             **kwargs: Additional query parameters.
             
         Returns:
-            API response as dictionary.
+            API response.
         """
         params = {
+            **self._base_params,
             "id": city_id,
-            "appid": self.api_key,
-            "units": kwargs.get("units", "metric"),
             **kwargs
         }
         
         self.logger.info(f"Getting weather for city ID: {city_id}")
         
-        response = await self.request_context.get(
-            f"{self.base_url}/weather",
-            params=params
-        )
-        
-        return {
-            "status": response.status,
-            "headers": dict(response.headers),
-            "data": await response.json() if response.ok else await response.text()
-        }
+        return await self._get(f"{self.base_url}/weather", params)
         
-    async def get_5_day_forecast(self, city: str, **kwargs) -> Dict[str, Any]:
+    async def get_5_day_forecast(self, city: str, **kwargs: Any) -> ApiResponse:
         """Get 5-day weather forecast for a city.
         
         Args:
@@ -121,29 +308,19 @@ class WeatherAPIClient:
             **kwargs: Additional query parameters.
             
         Returns:
-            API response as dictionary.
+            API response.
         """
         params = {
+            **self._base_params,
             "q": city,
-            "appid": self.api_key,
-            "units": kwargs.get("units", "metric"),
             **kwargs
         }
         
         self.logger.info(f"Getting 5-day forecast for: {city}")
         
-        response = await self.request_context.get(
-            f"{self.base_url}/forecast",
-            params=params
-        )
-        
-        return {
-            "status": response.status,
-            "headers": dict(response.headers),
-            "data": await response.json() if response.ok else await response.text()
-        }
+        return await self._get(f"{self.base_url}/forecast", params)
         
-    async def search_cities(self, query: str, limit: int = 5) -> Dict[str, Any]:
+    async def search_cities(self, query: str, limit: int = 5) -> ApiResponse:
         """Search for cities using geocoding API.
         
         Args:
@@ -151,7 +328,7 @@ class WeatherAPIClient:
             limit: Number of results to return.
             
         Returns:
-            API response as dictionary.
+            API response.
         """
         params = {
             "q": query,
@@ -161,16 +338,7 @@ class WeatherAPIClient:
         
         self.logger.info(f"Searching cities for: {query}")
         
-        response = await self.request_context.get(
-            "http://api.openweathermap.org/geo/1.0/direct",
-            params=params
-        )
-        
-        return {
-            "status": response.status,
-            "headers": dict(response.headers),
-            "data": await response.json() if response.ok else await response.text()
-        }
+        return await self._get("http://api.openweathermap.org/geo/1.0/direct", params)
         
     def validate_weather_response(self, response_data: Dict[str, Any]) -> bool:
         """Validate weather API response structure.
@@ -181,12 +349,7 @@ class WeatherAPIClient:
         Returns:
             True if response is valid, False otherwise.
         """
-        required_fields = ["coord", "weather", "main", "wind", "clouds", "dt", "sys", "id", "name"]
-        
-        if not isinstance(response_data, dict):
-            return False
-            
-        return all(field in response_data for field in required_fields)
+        return isinstance(response_data, dict) and _REQUIRED_WEATHER.issubset(response_data)
         
     def validate_forecast_response(self, response_data: Dict[str, Any]) -> bool:
         """Validate forecast API response structure.
@@ -197,9 +360,4 @@ class WeatherAPIClient:
         Returns:
             True if response is valid, False otherwise.
         """
-        required_fields = ["cod", "message", "cnt", "list", "city"]
-        
-        if not isinstance(response_data, dict):
-            return False
-            
-        return all(field in response_data for field in required_fields) 
\ No newline at end of file
+        return isinstance(response_data, dict) and _REQUIRED_FORECAST.issubset(response_data) 
\ No newline at end of file
@@ -1,10 +1,13 @@
 """Application settings and configuration management."""
 
 import os
+from functools import lru_cache
 from typing import Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
+_ENV_FILE = ".env"
+
 
 class Settings(BaseSettings):
     """Application settings using Pydantic for validation and environment variable management."""
@@ -37,7 +40,10 @@ class Settings(BaseSettings):
     
     # Screenshot and video settings
     screenshot_mode: str = Field(default="only-on-failure", description="Screenshot capture mode")
-    video_mode: str = Field(default="retain-on-failure", description="Video capture mode")
+    video_mode: str = Field(
+        default="retain-on-failure",
+        description="Video capture mode; only 'on' records video, failures keep a trace instead"
+    )
     
     # Reporting settings
     allure_results_dir: str = Field(default="reports/allure-results", description="Allure results directory")
@@ -51,18 +57,16 @@ class Settings(BaseSettings):
     
     class Config:
         """Pydantic configuration."""
-        env_file = ".env"
+        env_file = _ENV_FILE
         env_file_encoding = "utf-8"
         case_sensitive = False
 
 
-# Global settings instance
-_settings: Optional[Settings] = None
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings singleton."""
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings 
\ No newline at end of file
+    """Get application settings singleton.
+    
+    The instance is built once per process; call ``get_settings.cache_clear()``
+    to re-read the environment (e.g. when parametrizing tests on configuration).
+    """
+    return Settings(_env_file=_ENV_FILE)  # type: ignore[call-arg] 
\ No newline at end of file
@@ -1,14 +1,38 @@
 """Base page class for Page Object Model implementation."""
 
-from typing import Any, Optional, Union
-from playwright.async_api import Page, Locator, expect
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any, ClassVar, Optional, Tuple, Union
+from playwright.async_api import expect
 from src.config import get_settings
 from src.utils import get_logger
 
+if TYPE_CHECKING:
+    from playwright.async_api import Locator, Page, StorageState
+
 
 class BasePage:
     """Base page class providing common functionality for all page objects."""
     
+    _logger: ClassVar[logging.Logger] = get_logger("BasePage")
+    
+    # Empties the current origin's web storage, then restores its baseline local storage
+    RESET_STORAGE_SCRIPT = """
+    (baseline) => {
+        localStorage.clear();
+        sessionStorage.clear();
+        for (const { name, value } of baseline[location.origin] || []) {
+            localStorage.setItem(name, value);
+        }
+    }
+    """
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Give every page object class its own logger, created once."""
+        super().__init_subclass__(**kwargs)
+        cls._logger = get_logger(cls.__name__)
+        
     def __init__(self, page: Page) -> None:
         """Initialize base page.
         
@@ -17,7 +41,7 @@ class BasePage:
         """
         self.page = page
         self.settings = get_settings()
-        self.logger = get_logger(self.__class__.__name__)
+        self.logger = self._logger
         
     async def navigate_to(self, url: str) -> None:
         """Navigate to a specific URL.
@@ -28,6 +52,27 @@ class BasePage:
         self.logger.info(f"Navigating to: {url}")
         await self.page.goto(url)
         
+    async def reset(self, storage_state: Optional[StorageState] = None) -> None:
+        """Return the page to a blank state so it can be reused by the next test.
+        
+        Clears every cookie plus the web storage of the origin the page is on;
+        storage of other origins visited earlier is left untouched.
+        
+        Args:
+            storage_state: Baseline state whose cookies, and local storage for
+                the current origin, are restored after clearing.
+        """
+        if self.page.url.startswith(("http://", "https://")):
+            baseline = {
+                origin["origin"]: origin["localStorage"]
+                for origin in (storage_state or {}).get("origins", [])
+            }
+            await self.page.evaluate(self.RESET_STORAGE_SCRIPT, baseline)
+        await self.page.goto("about:blank")
+        await self.page.context.clear_cookies()
+        if storage_state and storage_state.get("cookies"):
+            await self.page.context.add_cookies(storage_state["cookies"])  # type: ignore[arg-type]
+        
     async def wait_for_page_load(self) -> None:
         """Wait for page to be fully loaded."""
         await self.page.wait_for_load_state("networkidle")
@@ -48,6 +93,15 @@ class BasePage:
         """
         return self.page.url
         
+    async def get_title_and_url(self) -> Tuple[str, str]:
+        """Get page title and current URL in a single round trip.
+        
+        Returns:
+            Tuple of page title and current URL.
+        """
+        result = await self.page.evaluate("() => ({ title: document.title, url: location.href })")
+        return result["title"], result["url"]
+        
     async def click_element(self, locator: Union[str, Locator]) -> None:
         """Click an element.
         
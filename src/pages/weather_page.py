@@ -1,9 +1,15 @@
 """Weather page class for OpenWeatherMap UI testing."""
 
-from typing import Optional
-from playwright.async_api import Page
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
+from playwright.async_api import TimeoutError as PWTimeout
 from .base_page import BasePage
 
+if TYPE_CHECKING:
+    from playwright.async_api import Locator, Page
+
 
 class WeatherPage(BasePage):
     """Page object for OpenWeatherMap weather page."""
@@ -17,6 +23,65 @@ class WeatherPage(BasePage):
     WEATHER_DESCRIPTION = "[data-testid='description'], .weather-description"
     ERROR_MESSAGE = "[data-testid='error'], .error, .alert"
     
+    # Fallback selectors joined into one CSS union so a single query covers them all
+    SEARCH_INPUT_UNION = ", ".join([
+        SEARCH_INPUT,
+        "input[name='q']",
+        "input[id*='search']",
+        "input[placeholder*='Search']"
+    ])
+    TEMPERATURE_UNION = ", ".join([
+        TEMPERATURE,
+        ".temperature",
+        ".temp",
+        "[class*='temperature']"
+    ])
+    WEATHER_DESCRIPTION_UNION = ", ".join([
+        WEATHER_DESCRIPTION,
+        ".description",
+        ".weather-desc",
+        "[class*='description']"
+    ])
+    WEATHER_INFO_UNION = ", ".join([
+        WEATHER_INFO,
+        ".weather",
+        ".current-weather",
+        "[class*='weather']"
+    ])
+    ERROR_MESSAGE_UNION = ", ".join([
+        ERROR_MESSAGE,
+        ".error",
+        ".alert-danger",
+        "[class*='error']"
+    ])
+    
+    # Ordered by priority: generic headings must not win over the dedicated selector
+    CITY_NAME_SELECTORS = (
+        CITY_NAME,
+        "h1",
+        "h2",
+        ".city",
+        "[class*='city']"
+    )
+    
+    # Reads city and temperature in one round trip, with the same priority and visibility rules as the getters
+    UI_SNAPSHOT_SCRIPT = """
+    ({ temperature, cityNames }) => {
+        const visible = (element) => {
+            if (!element) return false;
+            const rect = element.getBoundingClientRect();
+            return rect.width > 0 && rect.height > 0 && getComputedStyle(element).visibility !== "hidden";
+        };
+        const firstVisible = (selector) => Array.from(document.querySelectorAll(selector)).find(visible);
+        const temperatureElement = firstVisible(temperature);
+        const cityElement = cityNames.map(firstVisible).find(Boolean);
+        return {
+            city: cityElement ? cityElement.textContent : null,
+            temperature: temperatureElement ? temperatureElement.textContent : null
+        };
+    }
+    """
+    
     def __init__(self, page: Page) -> None:
         """Initialize weather page.
         
@@ -24,6 +89,25 @@ class WeatherPage(BasePage):
             page: Playwright page instance.
         """
         super().__init__(page)
+        self._search_input = self._first_visible_match(self.SEARCH_INPUT_UNION)
+        self._temperature = self._first_visible_match(self.TEMPERATURE_UNION)
+        self._weather_description = self._first_visible_match(self.WEATHER_DESCRIPTION_UNION)
+        self._weather_info = self._first_visible_match(self.WEATHER_INFO_UNION)
+        self._error_message = self._first_visible_match(self.ERROR_MESSAGE_UNION)
+        
+    def _first_visible_match(self, selector: str) -> Locator:
+        """Build a locator for the first visible element matching a selector.
+        
+        Hidden matches are skipped, so a broad fallback that hits a hidden
+        element earlier in the DOM does not mask a visible one.
+        
+        Args:
+            selector: CSS selector, possibly a union of fallbacks.
+            
+        Returns:
+            Locator for the first visible match in DOM order.
+        """
+        return self.page.locator(f"{selector} >> visible=true").first
         
     async def navigate_to_weather_page(self) -> None:
         """Navigate to the weather page."""
@@ -38,26 +122,9 @@ class WeatherPage(BasePage):
         """
         self.logger.info(f"Searching for weather in: {city_name}")
         
-        # Try multiple possible search input selectors
-        search_selectors = [
-            self.SEARCH_INPUT,
-            "input[name='q']",
-            "input[id*='search']",
-            "input[placeholder*='Search']"
-        ]
-        
-        search_input = None
-        for selector in search_selectors:
-            try:
-                search_input = self.page.locator(selector).first
-                if await search_input.is_visible(timeout=5000):
-                    break
-            except:
-                continue
-                
-        if search_input:
-            await search_input.fill(city_name)
-            await search_input.press("Enter")
+        if await self._is_locator_visible(self._search_input, timeout=5000):
+            await self._search_input.fill(city_name)
+            await self._search_input.press("Enter")
         else:
             # Fallback to URL navigation if search input not found
             search_url = f"{self.settings.ui_base_url}/find?q={city_name}"
@@ -65,28 +132,77 @@ class WeatherPage(BasePage):
             
         await self.wait_for_page_load()
         
+    async def _is_locator_visible(self, locator: Locator, timeout: int) -> bool:
+        """Wait for a locator to become visible.
+        
+        Args:
+            locator: Locator to wait for.
+            timeout: Timeout in milliseconds.
+            
+        Returns:
+            True if the locator became visible within timeout, False otherwise.
+        """
+        try:
+            await locator.wait_for(state="visible", timeout=timeout)
+            return True
+        except PWTimeout:
+            return False
+            
+    async def _first_visible(self, selectors: Sequence[str], timeout: int = 5000) -> Optional[Locator]:
+        """Wait for several selectors concurrently and return the highest-priority visible match.
+        
+        Args:
+            selectors: Candidate selectors, in priority order.
+            timeout: Timeout in milliseconds applied to every selector.
+            
+        Returns:
+            Locator for the highest-priority selector that became visible, or None.
+        """
+        locators = [self._first_visible_match(selector) for selector in selectors]
+        tasks = {
+            asyncio.create_task(locator.wait_for(state="visible", timeout=timeout)): index
+            for index, locator in enumerate(locators)
+        }
+        pending = set(tasks)
+        visible: List[int] = []
+        try:
+            # A match only wins once every higher-priority selector has settled
+            while pending and not (visible and all(tasks[task] > min(visible) for task in pending)):
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        visible.append(tasks[task])
+                    elif not isinstance(error, PWTimeout):
+                        raise error
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            
+        return locators[min(visible)] if visible else None
+        
+    async def _get_visible_text(self, locator: Locator, timeout: int = 5000) -> Optional[str]:
+        """Get the text content of a locator once it is visible.
+        
+        Args:
+            locator: Locator to read.
+            timeout: Timeout in milliseconds.
+            
+        Returns:
+            Text content or None if the locator did not become visible.
+        """
+        if await self._is_locator_visible(locator, timeout):
+            return await locator.text_content()
+        return None
+        
     async def get_temperature(self) -> Optional[str]:
         """Get the current temperature.
         
         Returns:
             Temperature string or None if not found.
         """
-        temperature_selectors = [
-            self.TEMPERATURE,
-            ".temperature",
-            ".temp",
-            "[class*='temperature']"
-        ]
-        
-        for selector in temperature_selectors:
-            try:
-                element = self.page.locator(selector).first
-                if await element.is_visible(timeout=5000):
-                    return await element.text_content()
-            except:
-                continue
-                
-        return None
+        return await self._get_visible_text(self._temperature)
         
     async def get_city_name(self) -> Optional[str]:
         """Get the displayed city name.
@@ -94,23 +210,8 @@ class WeatherPage(BasePage):
         Returns:
             City name string or None if not found.
         """
-        city_selectors = [
-            self.CITY_NAME,
-            "h1",
-            "h2",
-            ".city",
-            "[class*='city']"
-        ]
-        
-        for selector in city_selectors:
-            try:
-                element = self.page.locator(selector).first
-                if await element.is_visible(timeout=5000):
-                    return await element.text_content()
-            except:
-                continue
-                
-        return None
+        locator = await self._first_visible(self.CITY_NAME_SELECTORS)
+        return await locator.text_content() if locator else None
         
     async def get_weather_description(self) -> Optional[str]:
         """Get the weather description.
@@ -118,22 +219,7 @@ class WeatherPage(BasePage):
         Returns:
             Weather description string or None if not found.
         """
-        description_selectors = [
-            self.WEATHER_DESCRIPTION,
-            ".description",
-            ".weather-desc",
-            "[class*='description']"
-        ]
-        
-        for selector in description_selectors:
-            try:
-                element = self.page.locator(selector).first
-                if await element.is_visible(timeout=5000):
-                    return await element.text_content()
-            except:
-                continue
-                
-        return None
+        return await self._get_visible_text(self._weather_description)
         
     async def is_weather_info_displayed(self) -> bool:
         """Check if weather information is displayed.
@@ -141,22 +227,7 @@ class WeatherPage(BasePage):
         Returns:
             True if weather info is visible, False otherwise.
         """
-        weather_selectors = [
-            self.WEATHER_INFO,
-            ".weather",
-            ".current-weather",
-            "[class*='weather']"
-        ]
-        
-        for selector in weather_selectors:
-            try:
-                element = self.page.locator(selector).first
-                if await element.is_visible(timeout=10000):
-                    return True
-            except:
-                continue
-                
-        return False
+        return await self._is_locator_visible(self._weather_info, timeout=10000)
         
     async def is_error_displayed(self) -> bool:
         """Check if error message is displayed.
@@ -164,22 +235,7 @@ class WeatherPage(BasePage):
         Returns:
             True if error is visible, False otherwise.
         """
-        error_selectors = [
-            self.ERROR_MESSAGE,
-            ".error",
-            ".alert-danger",
-            "[class*='error']"
-        ]
-        
-        for selector in error_selectors:
-            try:
-                element = self.page.locator(selector).first
-                if await element.is_visible(timeout=5000):
-                    return True
-            except:
-                continue
-                
-        return False
+        return await self._is_locator_visible(self._error_message, timeout=5000)
         
     async def get_error_message(self) -> Optional[str]:
         """Get error message text.
@@ -187,20 +243,20 @@ class WeatherPage(BasePage):
         Returns:
             Error message string or None if not found.
         """
-        if await self.is_error_displayed():
-            error_selectors = [
-                self.ERROR_MESSAGE,
-                ".error",
-                ".alert-danger",
-                "[class*='error']"
-            ]
+        return await self._get_visible_text(self._error_message)
+        
+    async def get_ui_snapshot(self) -> Dict[str, Any]:
+        """Get the displayed weather state in as few browser round trips as possible.
+        
+        Returns:
+            Dictionary with ``displayed`` (bool), ``city`` and ``temperature``
+            (text or None).
+        """
+        if not await self.is_weather_info_displayed():
+            return {"displayed": False, "city": None, "temperature": None}
             
-            for selector in error_selectors:
-                try:
-                    element = self.page.locator(selector).first
-                    if await element.is_visible(timeout=5000):
-                        return await element.text_content()
-                except:
-                    continue
-                    
-        return None 
\ No newline at end of file
+        values = await self.page.evaluate(
+            self.UI_SNAPSHOT_SCRIPT,
+            {"temperature": self.TEMPERATURE_UNION, "cityNames": list(self.CITY_NAME_SELECTORS)}
+        )
+        return {"displayed": True, **values}
\ No newline at end of file
@@ -1,6 +1,7 @@
 """Utility modules for the QA automation framework."""
 
 from .logger import get_logger
-from .helpers import generate_test_data, wait_for_condition
+from .helpers import generate_test_data, load_json, wait_for_condition, write_atomic
+from .route_cache import RouteCache
 
-__all__ = ["get_logger", "generate_test_data", "wait_for_condition"] 
\ No newline at end of file
+__all__ = ["get_logger", "generate_test_data", "load_json", "wait_for_condition", "write_atomic", "RouteCache"] 
\ No newline at end of file
@@ -1,20 +1,47 @@
 """Helper utility functions for the QA automation framework."""
 
 import asyncio
+import itertools
+import os
 import random
 import string
-from typing import Any, Callable, Dict, List, Optional
-from faker import Faker
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, AbstractSet, Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
+import orjson
 
-fake = Faker()
+if TYPE_CHECKING:
+    from faker import Faker
 
+_ALPHABET = string.ascii_letters + string.digits
+_TEST_DATA_POOL_SIZE = 256
+_CITIES: Tuple[str, ...] = (
+    "London",
+    "New York",
+    "Tokyo",
+    "Paris",
+    "Berlin",
+    "Sydney",
+    "Moscow",
+    "Mumbai",
+    "Cairo",
+    "Rio de Janeiro"
+)
+_test_data_counter = itertools.count()
 
-def generate_test_data() -> Dict[str, Any]:
-    """Generate random test data for testing purposes.
+
+@lru_cache(maxsize=1)
+def _fake() -> "Faker":
+    """Create the shared Faker instance on first use."""
+    from faker import Faker
     
-    Returns:
-        Dictionary containing various test data fields.
-    """
+    return Faker()
+
+
+def _build_test_data() -> Dict[str, Any]:
+    """Generate one random test data record."""
+    fake = _fake()
     return {
         "email": fake.email(),
         "first_name": fake.first_name(),
@@ -30,6 +57,30 @@ def generate_test_data() -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=1)
+def _test_data_pool(size: int = _TEST_DATA_POOL_SIZE) -> List[Dict[str, Any]]:
+    """Pre-generate a pool of test data records on first use."""
+    return [_build_test_data() for _ in range(size)]
+
+
+def generate_test_data(fresh: bool = False) -> Dict[str, Any]:
+    """Generate random test data for testing purposes.
+    
+    Records are served round-robin from a pre-generated pool, so consecutive
+    calls return different data without paying Faker's cost each time.
+    
+    Args:
+        fresh: Generate a brand new record instead of using the pool.
+        
+    Returns:
+        Dictionary containing various test data fields.
+    """
+    if fresh:
+        return _build_test_data()
+    pool = _test_data_pool()
+    return dict(pool[next(_test_data_counter) % len(pool)])
+
+
 def generate_random_string(length: int = 10) -> str:
     """Generate a random string of specified length.
     
@@ -39,68 +90,114 @@ def generate_random_string(length: int = 10) -> str:
     Returns:
         Random string.
     """
-    letters = string.ascii_letters + string.digits
-    return ''.join(random.choice(letters) for _ in range(length))
+    return ''.join(random.choices(_ALPHABET, k=length))
 
 
-def generate_cities() -> List[str]:
+def generate_cities() -> Tuple[str, ...]:
     """Generate a list of test cities for weather API testing.
     
     Returns:
-        List of city names.
+        Tuple of city names.
     """
-    return [
-        "London",
-        "New York",
-        "Tokyo",
-        "Paris",
-        "Berlin",
-        "Sydney",
-        "Moscow",
-        "Mumbai",
-        "Cairo",
-        "Rio de Janeiro"
-    ]
+    return _CITIES
 
 
 async def wait_for_condition(
     condition: Callable[[], bool],
-    timeout: int = 30,
+    *,
+    ready_event: Optional[asyncio.Event] = None,
+    timeout: float = 30,
     interval: float = 0.5,
     error_message: str = "Condition was not met within timeout"
 ) -> None:
     """Wait for a condition to be true within a timeout period.
     
+    When ``ready_event`` is given, the wait sleeps until whoever changes the
+    state sets the event and then checks the condition once. Otherwise the
+    condition is polled every ``interval`` seconds.
+    
     Args:
         condition: Callable that returns True when condition is met.
+        ready_event: Event set by the code that changes the awaited state.
         timeout: Maximum time to wait in seconds.
-        interval: Time between condition checks in seconds.
+        interval: Time between condition checks in seconds (polling only).
         error_message: Error message to raise if timeout is exceeded.
         
     Raises:
         TimeoutError: If condition is not met within timeout.
     """
-    start_time = asyncio.get_event_loop().time()
+    if condition():
+        return
+        
+    if ready_event is not None:
+        try:
+            await asyncio.wait_for(ready_event.wait(), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(error_message) from None
+        if not condition():
+            raise TimeoutError(error_message)
+        return
+        
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
     
-    while True:
-        if condition():
-            return
-            
-        current_time = asyncio.get_event_loop().time()
-        if current_time - start_time >= timeout:
+    while not condition():
+        if loop.time() >= deadline:
             raise TimeoutError(error_message)
             
-        await asyncio.sleep(interval)
+        await asyncio.sleep(interval if interval > 0 else 0)
+
+
+def load_json(content: Union[bytes, str]) -> Any:
+    """Parse a JSON document with orjson.
+    
+    Args:
+        content: Raw JSON body, e.g. ``httpx.Response.content``.
+        
+    Returns:
+        Parsed JSON value.
+    """
+    return orjson.loads(content)
+
+
+def write_atomic(path: Path, content: Union[bytes, str]) -> None:
+    """Write a file so concurrent readers only ever see the old or the complete new content.
+    
+    Args:
+        path: Destination file.
+        content: Bytes, or text encoded as UTF-8.
+    """
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+@lru_cache(maxsize=128)
+def _as_set(fields: Tuple[str, ...]) -> FrozenSet[str]:
+    """Convert a tuple of field names to a frozenset, reusing earlier conversions."""
+    return frozenset(fields)
 
 
-def validate_response_schema(response_data: Dict[str, Any], required_fields: List[str]) -> bool:
+def validate_response_schema(response_data: Dict[str, Any], required_fields: Iterable[str]) -> bool:
     """Validate that response data contains required fields.
     
     Args:
         response_data: Response data to validate.
-        required_fields: List of required field names.
+        required_fields: Required field names; sets and tuples avoid a per-call copy.
         
     Returns:
         True if all required fields are present, False otherwise.
     """
-    return all(field in response_data for field in required_fields) 
\ No newline at end of file
+    if isinstance(required_fields, tuple):
+        fields: AbstractSet[str] = _as_set(required_fields)
+    elif isinstance(required_fields, (set, frozenset)):
+        fields = required_fields
+    else:
+        fields = set(required_fields)
+    return fields <= response_data.keys()
\ No newline at end of file
@@ -1,39 +1,67 @@
 """Logging utility for the QA automation framework."""
 
+import atexit
 import logging
+import queue
 import sys
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 import colorlog
 
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+
+
+def _build_console_handler() -> logging.Handler:
+    """Create the colored stdout handler that performs the actual writes."""
+    handler = colorlog.StreamHandler(sys.stdout)
+    formatter = colorlog.ColoredFormatter(
+        "%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(message)s%(reset)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+        log_colors={
+            'DEBUG': 'cyan',
+            'INFO': 'green',
+            'WARNING': 'yellow',
+            'ERROR': 'red',
+            'CRITICAL': 'red,bg_white',
+        }
+    )
+    handler.setFormatter(formatter)
+    return handler
+
+
+@lru_cache(maxsize=1)
+def _start_listener() -> QueueListener:
+    """Start the background thread that drains queued log records to stdout."""
+    listener = QueueListener(_log_queue, _build_console_handler())
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
+@lru_cache(maxsize=None)
+def _build_logger(name: str) -> logging.Logger:
+    """Configure the named logger once; later lookups hit the cache."""
+    logger = logging.getLogger(name)
+    
+    if not logger.handlers:
+        _start_listener()
+        logger.addHandler(QueueHandler(_log_queue))
+        logger.setLevel(logging.INFO)
+        
+    return logger
+
 
 def get_logger(name: Optional[str] = None) -> logging.Logger:
     """Get a configured logger instance.
     
+    Records are put on a queue and written to stdout by a single listener
+    thread, so logging never blocks the caller on console I/O.
+    
     Args:
         name: Logger name. If None, uses the calling module name.
         
     Returns:
         Configured logger instance.
     """
-    logger_name = name or __name__
-    logger = logging.getLogger(logger_name)
-    
-    if not logger.handlers:
-        # Create console handler with color formatting
-        handler = colorlog.StreamHandler(sys.stdout)
-        formatter = colorlog.ColoredFormatter(
-            "%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(message)s%(reset)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-            log_colors={
-                'DEBUG': 'cyan',
-                'INFO': 'green',
-                'WARNING': 'yellow',
-                'ERROR': 'red',
-                'CRITICAL': 'red,bg_white',
-            }
-        )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        logger.setLevel(logging.INFO)
-        
-    return logger 
\ No newline at end of file
+    return _build_logger(name or __name__)
\ No newline at end of file
@@ -0,0 +1,73 @@
+"""Disk cache for static pages and assets requested through Playwright routes."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, FrozenSet, Tuple
+from .helpers import write_atomic
+from .logger import get_logger
+
+if TYPE_CHECKING:
+    from playwright.async_api import Route
+
+
+class RouteCache:
+    """Serve GET responses for pages and assets from disk, storing them on first fetch."""
+    
+    URL_PATTERN = "**/openweathermap.org/**"
+    RESOURCE_TYPES: FrozenSet[str] = frozenset(("document", "stylesheet", "script", "image", "font"))
+    # The stored body is already decoded, so its original framing headers no longer apply
+    SKIPPED_HEADERS: FrozenSet[str] = frozenset(("content-encoding", "content-length", "transfer-encoding"))
+    
+    def __init__(self, cache_dir: Path) -> None:
+        """Initialize the route cache.
+        
+        Args:
+            cache_dir: Directory holding the cached responses.
+        """
+        self.cache_dir = cache_dir
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.logger = get_logger(self.__class__.__name__)
+        
+    def _paths(self, url: str) -> Tuple[Path, Path]:
+        """Get the body and metadata files for a URL.
+        
+        Args:
+            url: Request URL, including its query string.
+            
+        Returns:
+            Tuple of body path and metadata path.
+        """
+        digest = hashlib.sha256(url.encode()).hexdigest()
+        return self.cache_dir / f"{digest}.body", self.cache_dir / f"{digest}.json"
+        
+    async def handle(self, route: Route) -> None:
+        """Fulfill a routed request from the cache, fetching and storing it on a miss.
+        
+        Args:
+            route: Playwright route for the intercepted request.
+        """
+        request = route.request
+        if request.method != "GET" or request.resource_type not in self.RESOURCE_TYPES:
+            await route.continue_()
+            return
+            
+        body_path, meta_path = self._paths(request.url)
+        if body_path.is_file() and meta_path.is_file():
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            await route.fulfill(status=meta["status"], headers=meta["headers"], body=body_path.read_bytes())
+            return
+            
+        response = await route.fetch()
+        if response.ok:
+            headers = {name: value for name, value in response.headers.items() if name.lower() not in self.SKIPPED_HEADERS}
+            # The body lands first, so a reader that finds the metadata also finds a complete body
+            write_atomic(body_path, await response.body())
+            write_atomic(
+                meta_path,
+                json.dumps({"url": request.url, "status": response.status, "headers": headers})
+            )
+            self.logger.info(f"Cached {request.resource_type}: {request.url}")
+        await route.fulfill(response=response)
\ No newline at end of file
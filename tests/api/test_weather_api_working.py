@@ -1,100 +1,134 @@
 """Working API tests for OpenWeatherMap weather endpoints using httpx directly."""
 
+import asyncio
+import statistics
+import time
 import pytest
 import allure
 import httpx
-from src.config import get_settings
+from jsonschema import Draft7Validator
+from src.utils import load_json
+
+RESPONSE_TIME_SAMPLES = 5
+
+# Reasonable temperature range and scale name per unit system
+_TEMP_RANGES = {
+    "metric": (-50, 50, "Celsius"),
+    "imperial": (-58, 122, "Fahrenheit")
+}
 
 
 @allure.epic("API Testing")
 @allure.feature("Weather API")
 class TestWeatherAPIWorking:
     """Working test class for Weather API endpoints using httpx."""
+    
+    MATRIX_CITIES = ("London", "Paris", "Tokyo", "New York")
+    MATRIX_UNITS = ("metric", "imperial")
+    MATRIX_COORDINATES = (
+        {"lat": 51.5074, "lon": -0.1278},
+        {"lat": 40.7128, "lon": -74.0060},
+        {"lat": 35.6762, "lon": 139.6503}
+    )
+    MAX_CONCURRENT_REQUESTS = 5
+
+    @pytest.mark.api
+    @pytest.mark.smoke
+    @pytest.mark.critical
+    @allure.title("Weather data matrix for cities, units and coordinates")
+    @allure.description("Request every city/unit and coordinate combination concurrently and validate each response")
+    @allure.severity(allure.severity_level.CRITICAL)
+    async def test_weather_matrix(self, cached_get, weather_validator: Draft7Validator):
+        """Test API-001/003/005 in one pass: concurrent weather requests."""
+        params_list = [{"q": city, "units": units} for city in self.MATRIX_CITIES for units in self.MATRIX_UNITS]
+        params_list += [{**coordinates, "units": "metric"} for coordinates in self.MATRIX_COORDINATES]
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        
+        async def fetch(params: dict) -> httpx.Response:
+            async with semaphore:
+                return await cached_get("/weather", params=params)
+        
+        with allure.step(f"Request weather data for {len(params_list)} cases concurrently"):
+            responses = await asyncio.gather(*(fetch(params) for params in params_list))
+        
+        for params, response in zip(params_list, responses):
+            with allure.step(f"Verify response for {params}"):
+                assert response.status_code == 200, f"Expected status 200 for {params}, got {response.status_code}"
+                
+                data = load_json(response.content)
+                weather_validator.validate(data)
+                
+                if "q" in params:
+                    city = params["q"]
+                    assert data["name"].lower() in city.lower() or city.lower() in data["name"].lower()
+                else:
+                    assert abs(data["coord"]["lat"] - params["lat"]) < 1.0, "Latitude should be approximately correct"
+                    assert abs(data["coord"]["lon"] - params["lon"]) < 1.0, "Longitude should be approximately correct"
+                
+                if "units" in params:
+                    temp = data["main"]["temp"]
+                    low, high, scale = _TEMP_RANGES[params["units"]]
+                    assert low <= temp <= high, f"{scale} temperature {temp} should be in reasonable range for {params}"
 
     @pytest.mark.api
+    @pytest.mark.slow
     @pytest.mark.smoke
     @pytest.mark.critical
-    @pytest.mark.asyncio
     @allure.title("Get weather data for valid city")
     @allure.description("Test that the API returns valid weather data for a known city")
     @allure.severity(allure.severity_level.CRITICAL)
     @pytest.mark.parametrize("city", ["London", "Paris", "Tokyo", "New York"])
-    async def test_get_weather_valid_city(self, city: str):
+    async def test_get_weather_valid_city(self, cached_get, weather_validator: Draft7Validator, attach_json_on_failure, city: str):
         """Test API-001: Get weather data for valid city."""
-        settings = get_settings()
-        
-        if not settings.openweather_api_key:
-            pytest.skip("OpenWeatherMap API key not provided")
-        
         with allure.step(f"Request weather data for {city}"):
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{settings.openweather_base_url}/weather",
-                    params={
-                        "q": city,
-                        "appid": settings.openweather_api_key,
-                        "units": "metric"
-                    }
-                )
+            response = await cached_get(
+                "/weather",
+                params={
+                    "q": city,
+                    "units": "metric"
+                }
+            )
         
         with allure.step("Verify response status"):
             assert response.status_code == 200, f"Expected status 200, got {response.status_code}"
         
         with allure.step("Verify response structure"):
-            data = response.json()
-            assert isinstance(data, dict), "Response data should be a dictionary"
-            
-            # Validate response schema
-            assert "name" in data, "Response should contain city name"
-            assert "main" in data, "Response should contain main weather data"
-            assert "temp" in data["main"], "Response should contain temperature"
+            data = load_json(response.content)
+            attach_json_on_failure(data, f"Weather data for {city}")
+            weather_validator.validate(data)
             
         with allure.step("Verify response content"):
             assert data["name"].lower() in city.lower() or city.lower() in data["name"].lower()
-            
-            allure.attach(
-                str(data),
-                name=f"Weather data for {city}",
-                attachment_type=allure.attachment_type.JSON
-            )
 
     @pytest.mark.api
     @pytest.mark.regression
-    @pytest.mark.asyncio
     @allure.title("Handle invalid city gracefully")
     @allure.description("Test that the API handles invalid city names appropriately")
     @allure.severity(allure.severity_level.NORMAL)
-    async def test_invalid_city_handling(self):
+    async def test_invalid_city_handling(self, cached_get):
         """Test API-002: Handle invalid city names."""
-        settings = get_settings()
-        
-        if not settings.openweather_api_key:
-            pytest.skip("OpenWeatherMap API key not provided")
-        
         invalid_city = "InvalidCityName123456789"
         
         with allure.step(f"Request weather data for invalid city: {invalid_city}"):
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{settings.openweather_base_url}/weather",
-                    params={
-                        "q": invalid_city,
-                        "appid": settings.openweather_api_key,
-                        "units": "metric"
-                    }
-                )
+            response = await cached_get(
+                "/weather",
+                params={
+                    "q": invalid_city,
+                    "units": "metric"
+                }
+            )
         
         with allure.step("Verify error response"):
             assert response.status_code == 404, f"Expected status 404 for invalid city, got {response.status_code}"
             
             # Verify error message structure
-            data = response.json()
+            data = load_json(response.content)
             if isinstance(data, dict):
                 assert "message" in data or "cod" in data, "Error response should contain message or code"
 
     @pytest.mark.api
+    @pytest.mark.slow
     @pytest.mark.regression
-    @pytest.mark.asyncio
     @allure.title("Get weather by coordinates")
     @allure.description("Test weather API using geographical coordinates")
     @allure.severity(allure.severity_level.NORMAL)
@@ -103,33 +137,26 @@ class TestWeatherAPIWorking:
         {"lat": 40.7128, "lon": -74.0060, "city": "New York"},
         {"lat": 35.6762, "lon": 139.6503, "city": "Tokyo"}
     ])
-    async def test_get_weather_by_coordinates(self, coordinates: dict):
+    async def test_get_weather_by_coordinates(self, cached_get, weather_validator: Draft7Validator, coordinates: dict):
         """Test API-003: Get weather data using coordinates."""
-        settings = get_settings()
-        
-        if not settings.openweather_api_key:
-            pytest.skip("OpenWeatherMap API key not provided")
-        
         lat, lon, expected_city = coordinates["lat"], coordinates["lon"], coordinates["city"]
         
         with allure.step(f"Request weather data for coordinates: {lat}, {lon}"):
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{settings.openweather_base_url}/weather",
-                    params={
-                        "lat": lat,
-                        "lon": lon,
-                        "appid": settings.openweather_api_key,
-                        "units": "metric"
-                    }
-                )
+            response = await cached_get(
+                "/weather",
+                params={
+                    "lat": lat,
+                    "lon": lon,
+                    "units": "metric"
+                }
+            )
         
         with allure.step("Verify response status"):
             assert response.status_code == 200, f"Expected status 200, got {response.status_code}"
         
         with allure.step("Verify location accuracy"):
-            data = response.json()
-            assert "coord" in data, "Response should contain coordinates"
+            data = load_json(response.content)
+            weather_validator.validate(data)
             
             # Verify coordinates are approximately correct (within reasonable range)
             coord = data["coord"]
@@ -138,122 +165,85 @@ class TestWeatherAPIWorking:
 
     @pytest.mark.api
     @pytest.mark.performance
-    @pytest.mark.asyncio
     @allure.title("API response time validation")
     @allure.description("Verify API response times are within acceptable limits")
     @allure.severity(allure.severity_level.MINOR)
-    async def test_api_response_time(self):
+    async def test_api_response_time(self, http_client: httpx.AsyncClient, api_settings):
         """Test API performance: response time validation."""
-        settings = get_settings()
-        
-        if not settings.openweather_api_key:
-            pytest.skip("OpenWeatherMap API key not provided")
-        
-        import time
-        
-        with allure.step("Measure API response time"):
-            start_time = time.time()
-            
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{settings.openweather_base_url}/weather",
+        with allure.step(f"Measure API response time over {RESPONSE_TIME_SAMPLES} requests"):
+            samples = []
+            for _ in range(RESPONSE_TIME_SAMPLES):
+                start_ns = time.perf_counter_ns()
+                response = await http_client.get(
+                    "/weather",
                     params={
                         "q": "London",
-                        "appid": settings.openweather_api_key,
                         "units": "metric"
                     }
                 )
+                samples.append((time.perf_counter_ns() - start_ns) / 1_000_000)  # Convert to milliseconds
+                assert response.status_code == 200, "API call should succeed"
             
-            end_time = time.time()
-            response_time = (end_time - start_time) * 1000  # Convert to milliseconds
+            response_time = statistics.median(samples)
         
         with allure.step("Verify response time"):
-            assert response.status_code == 200, "API call should succeed"
-            assert response_time < settings.performance_threshold_ms, f"Response time {response_time:.2f}ms exceeds threshold {settings.performance_threshold_ms}ms"
+            assert response_time < api_settings.performance_threshold_ms, f"Response time {response_time:.2f}ms exceeds threshold {api_settings.performance_threshold_ms}ms"
             
             allure.attach(
-                f"Response time: {response_time:.2f}ms",
+                f"Median response time: {response_time:.2f}ms\nSamples: {', '.join(f'{sample:.2f}ms' for sample in samples)}",
                 name="Performance Data",
                 attachment_type=allure.attachment_type.TEXT
             )
 
     @pytest.mark.api
     @pytest.mark.regression
-    @pytest.mark.asyncio
     @allure.title("Test 5-day forecast endpoint")
     @allure.description("Test the 5-day forecast API endpoint")
     @allure.severity(allure.severity_level.NORMAL)
-    async def test_five_day_forecast(self):
+    async def test_five_day_forecast(self, cached_get, forecast_validator: Draft7Validator):
         """Test API-004: Get 5-day weather forecast."""
-        settings = get_settings()
-        
-        if not settings.openweather_api_key:
-            pytest.skip("OpenWeatherMap API key not provided")
-        
         with allure.step("Request 5-day forecast for London"):
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{settings.openweather_base_url}/forecast",
-                    params={
-                        "q": "London",
-                        "appid": settings.openweather_api_key,
-                        "units": "metric"
-                    }
-                )
+            response = await cached_get(
+                "/forecast",
+                params={
+                    "q": "London",
+                    "units": "metric"
+                }
+            )
         
         with allure.step("Verify response status"):
             assert response.status_code == 200, f"Expected status 200, got {response.status_code}"
         
         with allure.step("Verify forecast structure"):
-            data = response.json()
-            assert isinstance(data, dict), "Response data should be a dictionary"
-            assert "list" in data, "Forecast response should contain list of forecasts"
-            assert len(data["list"]) > 0, "Forecast should contain at least one entry"
-            
-            # Verify first forecast entry structure
-            first_forecast = data["list"][0]
-            assert "dt" in first_forecast, "Forecast should contain timestamp"
-            assert "main" in first_forecast, "Forecast should contain main weather data"
+            data = load_json(response.content)
+            forecast_validator.validate(data)
 
     @pytest.mark.api
+    @pytest.mark.slow
     @pytest.mark.regression
-    @pytest.mark.asyncio
     @allure.title("Test different temperature units")
     @allure.description("Test API with different temperature units (metric, imperial)")
     @allure.severity(allure.severity_level.MINOR)
     @pytest.mark.parametrize("units", ["metric", "imperial"])
-    async def test_temperature_units(self, units: str):
+    async def test_temperature_units(self, cached_get, weather_validator: Draft7Validator, units: str):
         """Test API-005: Different temperature units."""
-        settings = get_settings()
-        
-        if not settings.openweather_api_key:
-            pytest.skip("OpenWeatherMap API key not provided")
-        
         with allure.step(f"Request weather data with {units} units"):
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{settings.openweather_base_url}/weather",
-                    params={
-                        "q": "London",
-                        "appid": settings.openweather_api_key,
-                        "units": units
-                    }
-                )
+            response = await cached_get(
+                "/weather",
+                params={
+                    "q": "London",
+                    "units": units
+                }
+            )
         
         with allure.step("Verify response status"):
             assert response.status_code == 200, f"Expected status 200, got {response.status_code}"
         
         with allure.step("Verify temperature units"):
-            data = response.json()
-            assert "main" in data, "Response should contain main weather data"
-            assert "temp" in data["main"], "Response should contain temperature"
-            
-            # Verify temperature is numeric
+            data = load_json(response.content)
+            weather_validator.validate(data)
             temp = data["main"]["temp"]
-            assert isinstance(temp, (int, float)), "Temperature should be numeric"
             
             # Verify temperature is in reasonable range for the unit
-            if units == "metric":
-                assert -50 <= temp <= 50, "Celsius temperature should be in reasonable range"
-            elif units == "imperial":
-                assert -58 <= temp <= 122, "Fahrenheit temperature should be in reasonable range" 
\ No newline at end of file
+            low, high, scale = _TEMP_RANGES[units]
+            assert low <= temp <= high, f"{scale} temperature should be in reasonable range" 
\ No newline at end of file
@@ -1,34 +1,101 @@
 """End-to-end tests for complete user journeys."""
 
+import json
+import os
+import re
+from typing import Any, Dict, Mapping
 import pytest
 import allure
 from src.pages import WeatherPage
-from src.api import WeatherAPIClient
+from src.api import ApiResponse
+
+# URL checks compiled once and matched case-insensitively without lowercasing the URL
+_OWM_URL_RE = re.compile(r"openweathermap", re.IGNORECASE)
+_ERROR_URL_RE = re.compile(r"not found|error|search", re.IGNORECASE)
+
+JOURNEY_CITIES = ["London", "Paris"]
+INVALID_CITY = "InvalidCityXYZ123"
+
+
+async def _summarize_api_response(api_response: ApiResponse) -> Dict[str, Any]:
+    """Extract the fields the journeys compare against the UI.
+    
+    Args:
+        api_response: Precomputed current weather response.
+        
+    Returns:
+        Dictionary with the city name and temperature reported by the API.
+    """
+    api_data = await api_response.data()
+    return {"name": api_data.get("name", "Unknown"), "temp_celsius": api_data["main"]["temp"]}
 
 
 @allure.epic("E2E Testing")
 @allure.feature("Weather Journey")
+class TestWeatherJourneyAPI:
+    """API-only half of the journeys, runnable without starting a browser."""
+
+    @pytest.mark.e2e
+    @pytest.mark.api
+    @pytest.mark.api_only
+    @allure.title("Journey API precheck")
+    @allure.description("Validate the API responses the weather journeys rely on, without any UI work")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @pytest.mark.parametrize("city", JOURNEY_CITIES)
+    async def test_journey_api_precheck(
+        self,
+        precomputed_api_responses: Mapping[str, ApiResponse],
+        city: str
+    ):
+        """Test E2E-001 (API only): Journey city is served by the API."""
+        api_response = precomputed_api_responses[city]
+        assert api_response.status == 200, f"API should be accessible for {city}"
+        
+        api_summary = await _summarize_api_response(api_response)
+        assert api_summary["name"].lower() in city.lower() or city.lower() in api_summary["name"].lower()
+
+    @pytest.mark.e2e
+    @pytest.mark.api
+    @pytest.mark.api_only
+    @allure.title("Error journey API precheck")
+    @allure.description("Validate the API rejects the error journey's invalid city, without any UI work")
+    @allure.severity(allure.severity_level.NORMAL)
+    async def test_error_journey_api_precheck(self, precomputed_api_responses: Mapping[str, ApiResponse]):
+        """Test E2E-002 (API only): Invalid city is rejected by the API."""
+        api_response = precomputed_api_responses[INVALID_CITY]
+        assert api_response.status == 404, "API should return 404 for invalid city"
+
+
+@allure.epic("E2E Testing")
+@allure.feature("Weather Journey")
+@pytest.mark.usefixtures("fresh_page")
 class TestWeatherJourney:
     """Test class for end-to-end weather search journeys."""
 
     @pytest.mark.e2e
+    @pytest.mark.ui
     @pytest.mark.critical
     @allure.title("Complete weather search journey")
     @allure.description("Test complete user journey from search to weather display")
     @allure.severity(allure.severity_level.CRITICAL)
-    @pytest.mark.parametrize("city", ["London", "Paris"])
+    @pytest.mark.parametrize("city", JOURNEY_CITIES)
     async def test_complete_weather_search_journey(
         self, 
         weather_page: WeatherPage, 
-        weather_api: WeatherAPIClient,
+        precomputed_api_responses: Mapping[str, ApiResponse],
         city: str
     ):
         """Test E2E-001: Complete weather search user journey."""
+        # Collected observations are attached once, as JSON, at the end of the journey
+        summary: Dict[str, Any] = {"searched_city": city}
         
         with allure.step("Step 1: Validate API is accessible"):
-            # First ensure the API works for this city
-            api_response = await weather_api.get_current_weather(city)
-            assert api_response["status"] == 200, f"API should be accessible for {city}"
+            # Responses for every journey city were fetched concurrently once per session
+            api_response = precomputed_api_responses[city]
+            
+            # Fail fast: without API data there is nothing to cross-validate the UI against
+            if api_response.status != 200:
+                pytest.skip(f"API unavailable for {city} (status {api_response.status})")
         
         with allure.step("Step 2: Navigate to weather page"):
             await weather_page.navigate_to_weather_page()
@@ -43,32 +110,14 @@ class TestWeatherJourney:
         with allure.step("Step 4: Verify search results"):
             # Check if we're still on a valid OpenWeatherMap page
             current_url = await weather_page.get_url()
-            assert "openweathermap" in current_url.lower()
+            assert _OWM_URL_RE.search(current_url)
             
-            # Try to get weather information if displayed
-            is_weather_displayed = await weather_page.is_weather_info_displayed()
+            # Record whatever weather information is displayed
+            snapshot = await weather_page.get_ui_snapshot()
+            summary["ui_snapshot"] = snapshot
             
-            if is_weather_displayed:
-                with allure.step("Step 5: Validate displayed weather data"):
-                    # If weather is displayed, try to get the data
-                    displayed_city = await weather_page.get_city_name()
-                    temperature = await weather_page.get_temperature()
-                    
-                    if displayed_city:
-                        allure.attach(
-                            f"Displayed city: {displayed_city}",
-                            name="UI City Name",
-                            attachment_type=allure.attachment_type.TEXT
-                        )
-                    
-                    if temperature:
-                        allure.attach(
-                            f"Displayed temperature: {temperature}",
-                            name="UI Temperature",
-                            attachment_type=allure.attachment_type.TEXT
-                        )
-            else:
-                # If weather is not displayed, document this for analysis
+            # If weather is not displayed, document this for analysis
+            if not snapshot["displayed"] and os.getenv("ALLURE_VERBOSE"):
                 allure.attach(
                     f"Weather information not visually displayed for {city}. "
                     "This could be due to UI structure changes, API key requirements, "
@@ -77,15 +126,13 @@ class TestWeatherJourney:
                     attachment_type=allure.attachment_type.TEXT
                 )
         
-        with allure.step("Step 6: Cross-validate with API data"):
+        with allure.step("Step 5: Cross-validate with API data"):
             # Compare UI behavior with API response
-            api_data = api_response["data"]
-            
+            summary["api"] = await _summarize_api_response(api_response)
             allure.attach(
-                f"API returned: {api_data.get('name', 'Unknown')} - "
-                f"{api_data['main']['temp']}°C",
-                name="API Response Summary",
-                attachment_type=allure.attachment_type.TEXT
+                json.dumps(summary, ensure_ascii=False),
+                name="Journey Summary",
+                attachment_type=allure.attachment_type.JSON
             )
             
             # The journey is successful if:
@@ -95,6 +142,7 @@ class TestWeatherJourney:
             assert True, "E2E journey completed successfully"
 
     @pytest.mark.e2e
+    @pytest.mark.ui
     @pytest.mark.regression
     @allure.title("Error handling journey")
     @allure.description("Test user journey with invalid search input")
@@ -102,14 +150,14 @@ class TestWeatherJourney:
     async def test_error_handling_journey(
         self, 
         weather_page: WeatherPage, 
-        weather_api: WeatherAPIClient
+        precomputed_api_responses: Mapping[str, ApiResponse]
     ):
         """Test E2E-002: Error handling user journey."""
-        invalid_city = "InvalidCityXYZ123"
+        invalid_city = INVALID_CITY
         
         with allure.step("Step 1: Validate API error response"):
-            api_response = await weather_api.get_current_weather(invalid_city)
-            assert api_response["status"] == 404, "API should return 404 for invalid city"
+            api_response = precomputed_api_responses[invalid_city]
+            assert api_response.status == 404, "API should return 404 for invalid city"
         
         with allure.step("Step 2: Navigate to weather page"):
             await weather_page.navigate_to_weather_page()
@@ -120,15 +168,12 @@ class TestWeatherJourney:
         with allure.step("Step 4: Verify error handling"):
             # Check that the application handles the error gracefully
             current_url = await weather_page.get_url()
-            is_error_displayed = await weather_page.is_error_displayed()
             
-            # Either error should be displayed or URL should indicate an issue
-            error_handled = (
-                is_error_displayed or 
-                "not found" in current_url.lower() or 
-                "error" in current_url.lower() or
-                "search" in current_url.lower()
-            )
+            # Either URL should indicate an issue or error should be displayed;
+            # the URL is checked first so the DOM is only queried when needed
+            url_indicates_error = _ERROR_URL_RE.search(current_url) is not None
+            is_error_displayed = not url_indicates_error and await weather_page.is_error_displayed()
+            error_handled = url_indicates_error or is_error_displayed
             
             assert error_handled, "Application should handle invalid city searches gracefully"
             
@@ -136,7 +181,7 @@ class TestWeatherJourney:
                 error_message = await weather_page.get_error_message()
                 if error_message:
                     allure.attach(
-                        error_message,
-                        name="Error Message",
+                        "\n".join([f"Searched city: {invalid_city}", f"URL: {current_url}", f"Error message: {error_message}"]),
+                        name="Journey Summary",
                         attachment_type=allure.attachment_type.TEXT
                     ) 
\ No newline at end of file
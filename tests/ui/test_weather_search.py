@@ -1,12 +1,18 @@
 """UI tests for weather search functionality."""
 
+import re
 import pytest
 import allure
 from src.pages import WeatherPage
 
+# URL checks compiled once and matched case-insensitively without lowercasing the URL
+_OWM_URL_RE = re.compile(r"openweathermap", re.IGNORECASE)
+_ERROR_URL_RE = re.compile(r"not found|error", re.IGNORECASE)
+
 
 @allure.epic("UI Testing")
 @allure.feature("Weather Search")
+@pytest.mark.usefixtures("fresh_page")
 class TestWeatherSearch:
     """Test class for weather search functionality."""
 
@@ -22,10 +28,8 @@ class TestWeatherSearch:
         await weather_page.navigate_to_weather_page()
         
         # Assert
-        title = await weather_page.get_title()
+        title, current_url = await weather_page.get_title_and_url()
         assert "OpenWeatherMap" in title
-        
-        current_url = await weather_page.get_url()
         assert "openweathermap.org" in current_url
 
     @pytest.mark.ui
@@ -60,7 +64,7 @@ class TestWeatherSearch:
             
             # For demonstration purposes, we'll check if we're still on the same domain
             current_url = await weather_page.get_url()
-            assert "openweathermap" in current_url.lower()
+            assert _OWM_URL_RE.search(current_url)
 
     @pytest.mark.ui
     @pytest.mark.regression
@@ -78,12 +82,13 @@ class TestWeatherSearch:
             await weather_page.search_for_city(invalid_city)
         
         with allure.step("Verify error handling"):
-            # Check if error is displayed or if we're redirected appropriately
-            is_error_displayed = await weather_page.is_error_displayed()
+            # Check if we're redirected appropriately or if error is displayed
             current_url = await weather_page.get_url()
+            url_indicates_error = _ERROR_URL_RE.search(current_url) is not None
             
-            # Either error should be displayed or URL should indicate no results
-            assert is_error_displayed or "not found" in current_url.lower() or "error" in current_url.lower()
+            # Either URL should indicate no results or error should be displayed;
+            # the DOM is only queried when the URL is not conclusive
+            assert url_indicates_error or await weather_page.is_error_displayed()
 
     @pytest.mark.ui
     @pytest.mark.accessibility
@@ -100,9 +105,13 @@ class TestWeatherSearch:
             assert title and len(title.strip()) > 0
         
         with allure.step("Check page structure"):
-            # Verify basic HTML structure elements exist
-            has_main = await page.locator("main, [role='main']").count() > 0
-            has_nav = await page.locator("nav, [role='navigation']").count() > 0
+            # Verify basic HTML structure elements exist, with both lookups in one round trip
+            landmarks = await page.evaluate(
+                """() => ({
+                    main: document.querySelector("main, [role='main']") !== null,
+                    nav: document.querySelector("nav, [role='navigation']") !== null
+                })"""
+            )
             
             # At least one of these should exist for good page structure
-            assert has_main or has_nav 
\ No newline at end of file
+            assert landmarks["main"] or landmarks["nav"] 
\ No newline at end of file
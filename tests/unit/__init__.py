@@ -0,0 +1 @@
+"""Unit test package.""" 
\ No newline at end of file
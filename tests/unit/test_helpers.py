@@ -0,0 +1,151 @@
+"""Unit tests for the framework helper functions."""
+
+import asyncio
+from typing import Callable, Iterable, Tuple
+import pytest
+import allure
+from src.utils import generate_test_data, wait_for_condition
+from src.utils.helpers import _test_data_pool, validate_response_schema
+
+
+@allure.epic("Unit Testing")
+@allure.feature("Helpers")
+class TestWaitForCondition:
+    """Test class for wait_for_condition."""
+    
+    @pytest.mark.unit
+    @allure.title("Return once the ready event is set")
+    async def test_event_set_before_timeout(self):
+        """Test UNIT-H-001: The event path returns when the state changes in time."""
+        state = {"ready": False}
+        ready_event = asyncio.Event()
+        
+        def make_ready() -> None:
+            state["ready"] = True
+            ready_event.set()
+        
+        asyncio.get_running_loop().call_later(0.01, make_ready)
+        
+        await wait_for_condition(lambda: state["ready"], ready_event=ready_event, timeout=1)
+        
+        assert state["ready"]
+    
+    @pytest.mark.unit
+    @allure.title("Raise with the error message when the event never fires")
+    async def test_event_timeout_raises(self):
+        """Test UNIT-H-002: The event path raises TimeoutError with error_message."""
+        with pytest.raises(TimeoutError, match="never ready"):
+            await wait_for_condition(
+                lambda: False,
+                ready_event=asyncio.Event(),
+                timeout=0.01,
+                error_message="never ready"
+            )
+    
+    @pytest.mark.unit
+    @allure.title("Raise when the event fires but the condition is still false")
+    async def test_event_set_without_condition_raises(self):
+        """Test UNIT-H-003: A set event alone does not satisfy the wait."""
+        ready_event = asyncio.Event()
+        ready_event.set()
+        
+        with pytest.raises(TimeoutError, match="still false"):
+            await wait_for_condition(lambda: False, ready_event=ready_event, timeout=1, error_message="still false")
+    
+    @pytest.mark.unit
+    @allure.title("Poll until the condition becomes true")
+    async def test_polling_until_condition(self):
+        """Test UNIT-H-004: Without an event the condition is polled every interval."""
+        checks = []
+        
+        def condition() -> bool:
+            checks.append(None)
+            return len(checks) >= 3
+        
+        await wait_for_condition(condition, timeout=1, interval=0.001)
+        
+        assert len(checks) == 3
+    
+    @pytest.mark.unit
+    @allure.title("Raise when polling exceeds the timeout")
+    async def test_polling_timeout_raises(self):
+        """Test UNIT-H-005: The polling path raises TimeoutError with error_message."""
+        with pytest.raises(TimeoutError, match="polling gave up"):
+            await wait_for_condition(lambda: False, timeout=0.01, interval=0.001, error_message="polling gave up")
+
+
+@allure.epic("Unit Testing")
+@allure.feature("Helpers")
+class TestGenerateTestData:
+    """Test class for generate_test_data."""
+    
+    @pytest.mark.unit
+    @allure.title("Default calls rotate through the pre-generated pool")
+    def test_default_calls_rotate_through_pool(self):
+        """Test UNIT-H-006: Consecutive calls return successive pool records, wrapping around."""
+        pool = _test_data_pool()
+        records = [generate_test_data() for _ in range(len(pool) + 1)]
+        
+        start = pool.index(records[0])
+        assert [pool.index(record) for record in records[:3]] == [(start + step) % len(pool) for step in range(3)]
+        assert records[-1] == records[0], "The pool should wrap around after every record was served"
+    
+    @pytest.mark.unit
+    @allure.title("Pooled records are copies")
+    def test_pooled_records_are_copies(self):
+        """Test UNIT-H-007: Mutating a returned record leaves the pool untouched."""
+        record = generate_test_data()
+        index = _test_data_pool().index(record)
+        
+        record["email"] = "changed@example.com"
+        
+        assert _test_data_pool()[index]["email"] != "changed@example.com"
+    
+    @pytest.mark.unit
+    @allure.title("fresh=True builds a new record")
+    def test_fresh_builds_new_record(self):
+        """Test UNIT-H-008: A fresh record is not taken from the pool and does not advance the rotation."""
+        pool = _test_data_pool()
+        before = pool.index(generate_test_data())
+        
+        fresh = generate_test_data(fresh=True)
+        after = pool.index(generate_test_data())
+        
+        assert fresh not in pool
+        assert set(fresh) == set(pool[0])
+        assert after == (before + 1) % len(pool)
+
+
+WEATHER_DATA = {"name": "London", "main": {"temp": 12.5}, "coord": {"lat": 51.5, "lon": -0.1}}
+_FIELD_CONTAINERS: Tuple[Callable[[Tuple[str, ...]], Iterable[str]], ...] = (tuple, list, set, frozenset, iter)
+
+
+@allure.epic("Unit Testing")
+@allure.feature("Helpers")
+class TestValidateResponseSchema:
+    """Test class for validate_response_schema."""
+    
+    @pytest.mark.unit
+    @allure.title("Match the field-by-field check for every iterable type")
+    @pytest.mark.parametrize("container", _FIELD_CONTAINERS, ids=lambda container: container.__name__)
+    @pytest.mark.parametrize("fields", [
+        (),
+        ("name",),
+        ("name", "main", "coord"),
+        ("name", "wind"),
+        ("wind", "clouds")
+    ])
+    def test_matches_all_loop(self, container: Callable[[Tuple[str, ...]], Iterable[str]], fields: Tuple[str, ...]):
+        """Test UNIT-H-009: Results equal all(field in data for field in fields)."""
+        expected = all(field in WEATHER_DATA for field in fields)
+        
+        assert validate_response_schema(WEATHER_DATA, container(fields)) is expected
+    
+    @pytest.mark.unit
+    @allure.title("Cached tuple conversions do not leak between payloads")
+    def test_cached_tuple_checks_each_payload(self):
+        """Test UNIT-H-010: The same tuple is re-checked against each response."""
+        fields = ("name", "main")
+        
+        assert validate_response_schema(WEATHER_DATA, fields) is True
+        assert validate_response_schema({"name": "London"}, fields) is False
\ No newline at end of file
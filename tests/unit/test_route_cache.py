@@ -0,0 +1,132 @@
+"""Unit tests for the Playwright route disk cache."""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import pytest
+import allure
+from src.utils import RouteCache
+
+PAGE_URL = "https://openweathermap.org/city/2643743"
+
+
+@dataclass
+class FakeRequest:
+    """Subset of a Playwright request used by the cache."""
+    
+    url: str = PAGE_URL
+    method: str = "GET"
+    resource_type: str = "document"
+
+
+@dataclass
+class FakeResponse:
+    """Subset of a Playwright APIResponse returned by route.fetch()."""
+    
+    status: int = 200
+    headers: Dict[str, str] = field(default_factory=lambda: {
+        "content-type": "text/html; charset=utf-8",
+        "cache-control": "max-age=60",
+        "content-encoding": "gzip",
+        "content-length": "4"
+    })
+    payload: bytes = b"<h1>London</h1>"
+    
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status <= 299
+    
+    async def body(self) -> bytes:
+        return self.payload
+
+
+class FakeRoute:
+    """Route double recording how a request was settled."""
+    
+    def __init__(self, request: FakeRequest, response: Optional[FakeResponse] = None) -> None:
+        self.request = request
+        self.response = response or FakeResponse()
+        self.fetches = 0
+        self.continued = False
+        self.fulfilled: List[Dict[str, Any]] = []
+    
+    async def fetch(self) -> FakeResponse:
+        self.fetches += 1
+        return self.response
+    
+    async def continue_(self) -> None:
+        self.continued = True
+    
+    async def fulfill(self, **kwargs: Any) -> None:
+        self.fulfilled.append(kwargs)
+
+
+@allure.epic("Unit Testing")
+@allure.feature("Route Cache")
+class TestRouteCache:
+    """Test class for RouteCache."""
+    
+    @pytest.mark.unit
+    @allure.title("Store a fetched response on a miss")
+    async def test_miss_is_fetched_and_stored(self, tmp_path: Path):
+        """Test UNIT-RC-001: A miss is fetched, stored and passed through."""
+        route = FakeRoute(FakeRequest())
+        
+        await RouteCache(tmp_path).handle(route)
+        
+        assert route.fetches == 1
+        assert route.fulfilled == [{"response": route.response}]
+        (meta_path,) = tmp_path.glob("*.json")
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        assert meta == {
+            "url": PAGE_URL,
+            "status": 200,
+            "headers": {"content-type": "text/html; charset=utf-8", "cache-control": "max-age=60"}
+        }
+        assert meta_path.with_suffix(".body").read_bytes() == b"<h1>London</h1>"
+    
+    @pytest.mark.unit
+    @allure.title("Replay a stored response on a hit")
+    async def test_hit_is_served_from_disk(self, tmp_path: Path):
+        """Test UNIT-RC-002: A hit replays status, headers and body without fetching."""
+        cache = RouteCache(tmp_path)
+        await cache.handle(FakeRoute(FakeRequest()))
+        
+        route = FakeRoute(FakeRequest())
+        await cache.handle(route)
+        
+        assert route.fetches == 0
+        assert route.fulfilled == [{
+            "status": 200,
+            "headers": {"content-type": "text/html; charset=utf-8", "cache-control": "max-age=60"},
+            "body": b"<h1>London</h1>"
+        }]
+    
+    @pytest.mark.unit
+    @allure.title("Do not store non-OK responses")
+    async def test_error_response_is_not_stored(self, tmp_path: Path):
+        """Test UNIT-RC-003: Error responses are passed through but never cached."""
+        route = FakeRoute(FakeRequest(), FakeResponse(status=503))
+        
+        await RouteCache(tmp_path).handle(route)
+        
+        assert route.fulfilled == [{"response": route.response}]
+        assert list(tmp_path.iterdir()) == []
+    
+    @pytest.mark.unit
+    @allure.title("Let uncached requests continue untouched")
+    @pytest.mark.parametrize("request_", [
+        FakeRequest(method="POST"),
+        FakeRequest(resource_type="xhr")
+    ], ids=["non-get", "excluded-resource-type"])
+    async def test_uncached_request_continues(self, tmp_path: Path, request_: FakeRequest):
+        """Test UNIT-RC-004: Non-GET requests and excluded resource types bypass the cache."""
+        route = FakeRoute(request_)
+        
+        await RouteCache(tmp_path).handle(route)
+        
+        assert route.continued
+        assert route.fetches == 0
+        assert route.fulfilled == []
+        assert list(tmp_path.iterdir()) == []
\ No newline at end of file